@@ -1,9 +1,17 @@
+import heapq
+import itertools
+import logging
+import logging.handlers
 import os
+import queue
 import sqlite3
 import time
-import uuid
-from flask import Flask, request, jsonify, abort
-from threading import Thread, Lock
+from collections import deque
+from contextlib import contextmanager
+import orjson
+from flask import Flask, request, jsonify, abort, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from threading import Thread, Lock, Event, local
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -17,50 +25,145 @@ ARCHIVE_DB = "archive.db"
 # Settings
 OFFLINE_THRESHOLD = int(os.getenv("OFFLINE_THRESHOLD", 90))
 BUFFER_ROTATE_SECONDS = 30 * 60  # 30 minutes
-ROTATE_CHECK_INTERVAL = 60       # Check rotation every 30s
+ROTATE_RETRY_INTERVAL = 60       # Wait after a failed rotation
+ROTATE_CHUNK_ROWS = 5000         # Rows moved per rotation transaction
+FLUSH_INTERVAL = 0.1             # Write buffered heartbeats every 100ms
+FLUSH_BATCH_SIZE = 64            # ...or as soon as this many are waiting
+HEARTBEAT_BUF_SIZE = 100000      # Heartbeats held in memory if flushes keep failing. When full,
+                                 # new heartbeats evict the oldest and a put-back batch evicts the newest.
+EVENT_QUEUE_SIZE = 10000         # Oldest alerts are dropped if the bot falls behind
+PULL_CHUNK_ROWS = 1000           # Archive rows serialized per streamed chunk
+
+# ================== LOGGING ==================
+
+log = logging.getLogger("central")
+
+def setup_logging():
+    """Writes log records from a background thread so callers never block on stdout."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("[CENTRAL] %(message)s"))
+    logging.handlers.QueueListener(log_queue, handler).start()
+
+    log.addHandler(logging.handlers.QueueHandler(log_queue))
+    log.setLevel(os.getenv("LOG_LEVEL", "INFO"))  # WARNING drops per-node events
+    log.propagate = False
+
+# ================== JSON ==================
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Routes jsonify and request.json through orjson."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skip the bytes -> str -> bytes round trip of the default implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default), mimetype=self.mimetype
+        )
+
+# /heartbeat's success body, serialized once. A fresh Response is still built
+# per request so after_request hooks can never leak headers between requests.
+OK_BODY = orjson.dumps({"ok": True})
 
 # ================== APP STATE ==================
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 db_lock = Lock()
+db_local = local()  # Per-thread SQLite connections, see get_db()
+# Batch ids only need to be unique per run; seeding with the start time keeps
+# an ack left over from before a restart from matching a new batch
+batch_ids = itertools.count(int(time.time()))
 current_batch_id = None
-event_queue = []  # Stores alerts for the bot
+current_batch_max_id = None  # Highest archive id in the batch sent to the bot
+event_queue = deque(maxlen=EVENT_QUEUE_SIZE)  # Stores alerts for the bot
+heartbeat_buf = deque(maxlen=HEARTBEAT_BUF_SIZE)  # Raw heartbeats waiting to be flushed to BUFFER_DB
+flush_wakeup = Event()   # Set when heartbeat_buf reaches FLUSH_BATCH_SIZE
+buf_overflow = 0         # Heartbeats evicted from a full heartbeat_buf, reported by the flusher
+overflow_lock = Lock()
+node_state = {}  # node -> (node_type, last_seen, status), rebuilt from live heartbeats
+state_lock = Lock()
+expiries = []    # Heap of (deadline, seq, node) for online nodes, see monitor_nodes()
+expiry_seq = itertools.count()  # Breaks deadline ties so node names are never compared
+expiry_lock = Lock()
 
 # ================== DB SETUP ==================
 
+def connect_db(path):
+    """Opens a SQLite connection tuned for frequent small writes."""
+    # Autocommit mode: writers open their own transactions via transaction()
+    db = sqlite3.connect(path, isolation_level=None)
+    # Per-connection settings (journal_mode=WAL is persisted by init_dbs)
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA temp_store=MEMORY")
+    db.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    db.execute("PRAGMA cache_size=-65536")    # 64 MB
+    return db
+
+def get_db(path):
+    """Returns this thread's connection to `path`, opening it on first use."""
+    conns = getattr(db_local, "conns", None)
+    if conns is None:
+        conns = db_local.conns = {}
+    db = conns.get(path)
+    if db is None:
+        db = conns[path] = connect_db(path)
+    return db
+
+@contextmanager
+def transaction(db):
+    """Runs the block as one BEGIN IMMEDIATE ... COMMIT on `db`."""
+    # IMMEDIATE takes the write lock up front instead of upgrading mid-transaction
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        yield db
+        db.commit()
+    except BaseException:
+        # Also covers a failed COMMIT, which would otherwise leave the
+        # transaction open on this persistent connection
+        if db.in_transaction:
+            db.rollback()
+        raise
+
 def init_dbs():
     # CLEAN START: Delete old databases on startup
     for f in [BUFFER_DB, ARCHIVE_DB]:
         if os.path.exists(f):
             try:
                 os.remove(f)
-                print(f"[CENTRAL] Deleted old {f}")
+                log.info("Deleted old %s", f)
             except Exception as e:
-                print(f"[CENTRAL] Failed to delete {f}: {e}")
+                log.error("Failed to delete %s: %s", f, e)
+
+    with connect_db(BUFFER_DB) as db:
+        # WAL lets readers run alongside the writer and avoids an fsync per commit
+        db.execute("PRAGMA journal_mode=WAL")
 
-    with sqlite3.connect(BUFFER_DB) as db:
-        # Raw heartbeats (temporary storage)
+        # Raw heartbeats (temporary storage). Keyed by (node, received_at), which
+        # also de-duplicates; the archive's seq is derived from it on rotation.
         db.execute("""
         CREATE TABLE IF NOT EXISTS heartbeats (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
             node TEXT NOT NULL,
-            node_type TEXT NOT NULL,
             received_at INTEGER NOT NULL,
-            seq TEXT UNIQUE
-        )
+            node_type TEXT NOT NULL,
+            PRIMARY KEY (node, received_at)
+        ) WITHOUT ROWID
         """)
-        # Current status tracker (for offline detection)
-        db.execute("""
-        CREATE TABLE IF NOT EXISTS node_status (
-            node TEXT PRIMARY KEY,
-            node_type TEXT,
-            last_seen INTEGER,
-            status TEXT DEFAULT 'online'
+        # Makes buffer_rotator's MIN(received_at) age check an index lookup
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_heartbeats_received_at ON heartbeats (received_at)"
         )
-        """)
         db.commit()
 
-    with sqlite3.connect(ARCHIVE_DB) as db:
+    with connect_db(ARCHIVE_DB) as db:
+        db.execute("PRAGMA journal_mode=WAL")
+
         # Long-term storage for batching
         db.execute("""
         CREATE TABLE IF NOT EXISTS heartbeats_archive (
@@ -72,7 +175,7 @@ def init_dbs():
         )
         """)
         db.commit()
-    print("[CENTRAL] Databases initialized")
+    log.info("Databases initialized")
 
 # ================== AUTH ==================
 
@@ -86,31 +189,33 @@ def require_api_key():
 @app.route("/heartbeat", methods=["POST"])
 def heartbeat():
     require_api_key()
-    data = request.json or {}
+    global buf_overflow
+
+    # Parse the body directly: skips content-type sniffing and body caching
+    raw = request.get_data(cache=False)
+    try:
+        data = orjson.loads(raw) if raw else {}
+    except orjson.JSONDecodeError:
+        return jsonify({"error": "bad json"}), 400
+    if not isinstance(data, dict):
+        return jsonify({"error": "invalid payload"}), 400
+
     node = data.get("node")
     node_type = data.get("node_type")
 
-    if not node or not node_type:
+    # Both must be non-empty strings; they key node_state, the deadline heap and the buffer
+    if not isinstance(node, str) or not isinstance(node_type, str) or not node or not node_type:
         return jsonify({"error": "invalid payload"}), 400
 
     now = int(time.time())
-    seq = f"{node}:{now}"
 
-    with db_lock, sqlite3.connect(BUFFER_DB) as db:
-        # 1. Store raw heartbeat
-        try:
-            db.execute(
-                "INSERT INTO heartbeats (node, node_type, received_at, seq) VALUES (?, ?, ?, ?)",
-                (node, node_type, now, seq)
-            )
-        except sqlite3.IntegrityError:
-            pass # Ignore duplicates
-
-        # 2. Check for Recovery (Offline -> Online)
-        row = db.execute("SELECT status FROM node_status WHERE node=?", (node,)).fetchone()
-        
+    # 1. Check for Recovery (Offline -> Online)
+    with state_lock:
+        prev = node_state.get(node)
+        node_state[node] = (node_type, now, "online")
+
         # If it was offline (or new), mark it online
-        if not row or row[0] == "offline":
+        if prev is None or prev[2] == "offline":
             # Add to event queue for the bot
             event_queue.append({
                 "node": node, 
@@ -118,84 +223,185 @@ def heartbeat():
                 "ts": now,
                 "node_type": node_type
             })
-            print(f"[CENTRAL] Event: Node {node} came ONLINE")
-
-        # 3. Update Status Table
-        db.execute("""
-            INSERT INTO node_status (node, node_type, last_seen, status) 
-            VALUES (?, ?, ?, 'online')
-            ON CONFLICT(node) DO UPDATE SET last_seen=excluded.last_seen, status='online'
-        """, (node, node_type, now))
-        db.commit()
-
-    return jsonify({"ok": True})
+            log.info("Event: Node %s came ONLINE", node)
+            schedule_expiry(node, now)
+
+    # 2. Queue raw heartbeat (written in batches by heartbeat_flusher)
+    if len(heartbeat_buf) >= HEARTBEAT_BUF_SIZE:
+        with overflow_lock:
+            buf_overflow += 1  # The append below evicts the oldest queued heartbeat
+    heartbeat_buf.append((node, node_type, now))
+    if len(heartbeat_buf) >= FLUSH_BATCH_SIZE:
+        flush_wakeup.set()
+
+    return app.response_class(OK_BODY, mimetype="application/json")
+
+# ================== HEARTBEAT FLUSHER ==================
+
+def flush_heartbeats():
+    """Writes the heartbeats queued so far to the buffer in one transaction."""
+    global buf_overflow
+    with overflow_lock:
+        evicted, buf_overflow = buf_overflow, 0
+    if evicted:
+        log.warning("Heartbeat buffer full: dropped %d oldest heartbeats", evicted)
+
+    # popleft is atomic, so heartbeats queued meanwhile wait for the next pass
+    batch = [heartbeat_buf.popleft() for _ in range(len(heartbeat_buf))]
+    if not batch:
+        return
+
+    sql = "INSERT OR IGNORE INTO heartbeats (node, node_type, received_at) VALUES (?, ?, ?)"
+    try:
+        with db_lock, transaction(get_db(BUFFER_DB)) as db:
+            try:
+                db.executemany(sql, batch)
+            except (sqlite3.InterfaceError, sqlite3.ProgrammingError):
+                # A row SQLite can't bind fails the whole statement. Write the rows
+                # one by one and drop the bad ones, so they can't block the queue.
+                for row in batch:
+                    try:
+                        db.execute(sql, row)
+                    except (sqlite3.InterfaceError, sqlite3.ProgrammingError) as e:
+                        log.error("Dropped heartbeat %r: %s", row, e)
+    except Exception as e:
+        # Put the batch back so it is retried on the next pass
+        evicted = len(heartbeat_buf) + len(batch) - HEARTBEAT_BUF_SIZE
+        heartbeat_buf.extendleft(reversed(batch))
+        log.error("Flush Error: %s", e)
+        if evicted > 0:
+            log.warning("Heartbeat buffer full: dropped %d newest heartbeats", evicted)
+
+def heartbeat_flusher():
+    """Flushes queued heartbeats every FLUSH_INTERVAL, or sooner when a batch fills."""
+    while True:
+        flush_wakeup.wait(FLUSH_INTERVAL)
+        flush_wakeup.clear()
+        flush_heartbeats()
 
 # ================== BACKGROUND MONITOR (WATCHER) ==================
 
+def schedule_expiry(node, last_seen):
+    """Queues the moment `node` goes stale if no newer heartbeat arrives."""
+    with expiry_lock:
+        heapq.heappush(expiries, (last_seen + OFFLINE_THRESHOLD + 1, next(expiry_seq), node))
+
 def monitor_nodes():
     """Checks for nodes that have stopped sending heartbeats."""
     while True:
-        time.sleep(10) # Check every 10 seconds
-        now = int(time.time())
-        
-        with db_lock, sqlite3.connect(BUFFER_DB) as db:
-            # Find nodes marked 'online' but haven't been seen in THRESHOLD
-            offline_nodes = db.execute("""
-                SELECT node, node_type FROM node_status 
-                WHERE status = 'online' AND (? - last_seen) > ?
-            """, (now, OFFLINE_THRESHOLD)).fetchall()
-
-            for node, n_type in offline_nodes:
-                # Mark as offline in DB
-                db.execute("UPDATE node_status SET status='offline' WHERE node=?", (node,))
-                
-                # Push event to queue
-                event_queue.append({
-                    "node": node, 
-                    "type": "offline", 
-                    "ts": now,
-                    "node_type": n_type
-                })
-                print(f"[CENTRAL] Event: Node {node} went OFFLINE")
-            
-            db.commit()
+        due = []  # Entries popped this pass; due[done:] are re-queued on error
+        done = 0
+        try:
+            # Sleep until the earliest deadline. Every later push is due at least
+            # OFFLINE_THRESHOLD from now, so waiting that long on an empty heap is safe.
+            with expiry_lock:
+                next_due = expiries[0][0] if expiries else None
+            delay = OFFLINE_THRESHOLD if next_due is None else next_due - time.time()
+            if delay > 0:
+                time.sleep(delay)
+                continue
+
+            now = int(time.time())
+            with expiry_lock:
+                while expiries and expiries[0][0] <= now:
+                    _, _, node = heapq.heappop(expiries)
+                    due.append(node)
+
+            went_offline = []
+            with state_lock:
+                for node in due:
+                    n_type, last_seen, _ = node_state[node]
+                    if now - last_seen <= OFFLINE_THRESHOLD:
+                        # Seen since this entry was queued; move to the new deadline
+                        schedule_expiry(node, last_seen)
+                        done += 1
+                        continue
+
+                    node_state[node] = (n_type, last_seen, "offline")
+
+                    # Push event to queue
+                    event_queue.append({
+                        "node": node, 
+                        "type": "offline", 
+                        "ts": now,
+                        "node_type": n_type
+                    })
+                    went_offline.append(node)
+                    done += 1
+
+            # One line per scan rather than per node, so a mass outage doesn't flood the log
+            if went_offline:
+                log.info("Event: %d node(s) went OFFLINE: %s", len(went_offline), ", ".join(went_offline))
+
+        except Exception as e:
+            log.error("Monitor Error: %s", e)
+            # Put back what this pass didn't handle; a dropped entry would never go offline
+            for node in due[done:]:
+                state = node_state.get(node)
+                if state is not None:
+                    schedule_expiry(node, state[1])
+            time.sleep(1)  # Don't spin if the error repeats
 
 # ================== ARCHIVE ROTATION ==================
 
 def buffer_rotator():
     """Moves data from Buffer to Archive every 30 minutes."""
+    # Own connection with the archive attached, so the move runs entirely inside SQLite
+    db = connect_db(BUFFER_DB)
+    db.execute("ATTACH DATABASE ? AS arc", (ARCHIVE_DB,))
+    db.execute("PRAGMA arc.synchronous=NORMAL")
+
     while True:
-        time.sleep(ROTATE_CHECK_INTERVAL)
         try:
-            with db_lock, sqlite3.connect(BUFFER_DB) as buf_db, sqlite3.connect(ARCHIVE_DB) as arc_db:
-                # Check age of oldest heartbeat
-                cur = buf_db.execute("SELECT MIN(received_at) FROM heartbeats")
-                row = cur.fetchone()
-                
-                if not row or not row[0]:
-                    continue # Buffer empty
-
-                oldest = row[0]
-                if int(time.time()) - oldest < BUFFER_ROTATE_SECONDS:
-                    continue # Not time yet
-
-                # Move data
-                rows = buf_db.execute("SELECT node, node_type, received_at, seq FROM heartbeats").fetchall()
-                if not rows: continue
-
-                arc_db.executemany(
-                    "INSERT OR IGNORE INTO heartbeats_archive (node, node_type, received_at, seq) VALUES (?, ?, ?, ?)",
-                    rows
-                )
-                arc_db.commit()
-
-                # Clear buffer
-                buf_db.execute("DELETE FROM heartbeats")
-                buf_db.commit()
-                print(f"[CENTRAL] Archived {len(rows)} heartbeats.")
+            # Check age of oldest heartbeat (plain read; WAL keeps it off the writers' lock)
+            cur = db.execute("SELECT MIN(received_at) FROM heartbeats")
+            row = cur.fetchone()
+            
+            if not row or not row[0]:
+                # Buffer empty: anything written from now on is due a full period later
+                time.sleep(BUFFER_ROTATE_SECONDS)
+                continue
+
+            oldest = row[0]
+            wait = oldest + BUFFER_ROTATE_SECONDS - time.time()
+            if wait > 0:
+                time.sleep(wait) # Sleep until the oldest heartbeat is due
+                continue
+
+            # Move data oldest-first in chunks so each transaction (and the WAL) stays
+            # small. A chunk ends on a whole second, so it may run past ROTATE_CHUNK_ROWS.
+            moved = 0
+            while True:
+                row = db.execute(
+                    "SELECT received_at FROM heartbeats ORDER BY received_at LIMIT 1 OFFSET ?",
+                    (ROTATE_CHUNK_ROWS - 1,)
+                ).fetchone()
+                bound = row[0] if row else int(time.time())
+
+                with db_lock, transaction(db):
+                    # A retry after a partial failure is absorbed by OR IGNORE on seq
+                    db.execute("""
+                        INSERT OR IGNORE INTO arc.heartbeats_archive (node, node_type, received_at, seq)
+                        SELECT node, node_type, received_at, node || ':' || received_at
+                        FROM heartbeats WHERE received_at <= ?
+                    """, (bound,))
+                    moved += db.execute(
+                        "DELETE FROM heartbeats WHERE received_at <= ?", (bound,)
+                    ).rowcount
+
+                if not row:
+                    break
+
+            # Fold the buffer's WAL back and reset it to zero length. The archive only
+            # gets a PASSIVE checkpoint: TRUNCATE would wait out the busy timeout,
+            # blocking archive writers, whenever an /archive/pull stream holds a snapshot.
+            db.execute("PRAGMA main.wal_checkpoint(TRUNCATE)")
+            db.execute("PRAGMA arc.wal_checkpoint(PASSIVE)")
+            log.info("Archived %d heartbeats.", moved)
 
         except Exception as e:
-            print(f"[CENTRAL] Rotation Error: {e}")
+            log.error("Rotation Error: %s", e)
+            time.sleep(ROTATE_RETRY_INTERVAL)
 
 # ================== BOT ENDPOINTS ==================
 
@@ -203,57 +409,82 @@ def buffer_rotator():
 def get_events():
     """Bot polls this endpoint to get instant alerts."""
     require_api_key()
-    global event_queue
-    
-    # Return events and clear queue
-    response = list(event_queue)
-    event_queue = [] 
+
+    # Drain with popleft (atomic) so events appended meanwhile are never lost
+    response = []
+    while True:
+        try:
+            response.append(event_queue.popleft())
+        except IndexError:
+            break
     return jsonify(response)
 
 @app.route("/archive/pull", methods=["GET"])
 def pull_archive():
     """Bot calls this every 30m to get history."""
     require_api_key()
-    global current_batch_id
+    global current_batch_id, current_batch_max_id
 
-    with db_lock, sqlite3.connect(ARCHIVE_DB) as db:
-        rows = db.execute(
-            "SELECT node, node_type, received_at, seq FROM heartbeats_archive"
-        ).fetchall()
+    # Read-only: WAL gives a consistent snapshot without taking db_lock.
+    # The batch is pinned to the rows present now; later ones wait for the next pull.
+    count, max_id = get_db(ARCHIVE_DB).execute(
+        "SELECT COUNT(*), MAX(id) FROM heartbeats_archive"
+    ).fetchone()
 
-    if not rows:
+    if not count:
         return jsonify({"count": 0, "data": []})
 
-    current_batch_id = str(uuid.uuid4())
-    print(f"[CENTRAL] Sending batch {current_batch_id} to bot")
+    batch_id = current_batch_id = next(batch_ids)
+    current_batch_max_id = max_id
+    log.info("Sending batch %s to bot", batch_id)
 
-    return jsonify({
-        "batch_id": current_batch_id,
-        "count": len(rows),
-        "data": [
-            {"node": r[0], "node_type": r[1], "received_at": r[2], "seq": r[3]} 
-            for r in rows
-        ]
-    })
+    def generate():
+        # Stream the rows in chunks instead of building the whole payload in memory
+        yield b'{"batch_id":%d,"count":%d,"data":[' % (batch_id, count)
+        cur = get_db(ARCHIVE_DB).execute(
+            "SELECT node, node_type, received_at, seq FROM heartbeats_archive WHERE id <= ?",
+            (max_id,)
+        )
+        sep = b""
+        while rows := cur.fetchmany(PULL_CHUNK_ROWS):
+            chunk = orjson.dumps([
+                {"node": r[0], "node_type": r[1], "received_at": r[2], "seq": r[3]}
+                for r in rows
+            ])
+            yield sep + chunk[1:-1]  # Drop the list brackets, the outer array has them
+            sep = b","
+        yield b"]}"
+
+    return app.response_class(stream_with_context(generate()), mimetype="application/json")
 
 @app.route("/archive/ack", methods=["POST"])
 def archive_ack():
     """Bot confirms it saved the data, so we can delete it."""
     require_api_key()
-    global current_batch_id
+    global current_batch_id, current_batch_max_id
 
     data = request.json or {}
-    batch_id = data.get("batch_id")
+    if not isinstance(data, dict):
+        return jsonify({"error": "invalid batch"}), 400
 
-    if not batch_id or batch_id != current_batch_id:
+    # Ids are ints; the bot may echo one back as a string. Bools and floats are rejected.
+    raw_id = data.get("batch_id")
+    if isinstance(raw_id, bool) or not isinstance(raw_id, (int, str)):
+        return jsonify({"error": "invalid batch"}), 400
+    try:
+        batch_id = int(raw_id)
+    except ValueError:
         return jsonify({"error": "invalid batch"}), 400
 
-    with db_lock, sqlite3.connect(ARCHIVE_DB) as db:
-        db.execute("DELETE FROM heartbeats_archive")
-        db.commit()
+    if batch_id != current_batch_id:
+        return jsonify({"error": "invalid batch"}), 400
 
-    print(f"[CENTRAL] Batch {batch_id} acknowledged & cleared.")
-    current_batch_id = None
+    # Only delete what was sent; rows archived after the pull stay for the next batch
+    with db_lock, transaction(get_db(ARCHIVE_DB)) as db:
+        db.execute("DELETE FROM heartbeats_archive WHERE id <= ?", (current_batch_max_id,))
+
+    log.info("Batch %s acknowledged & cleared.", batch_id)
+    current_batch_id = current_batch_max_id = None
     return jsonify({"ok": True})
 
 @app.route("/")
@@ -262,15 +493,24 @@ def health():
 
 # ================== MAIN ==================
 
-if __name__ == "__main__":
+def start():
+    """Prepares the databases and starts the background threads."""
+    setup_logging()
+
     if not CENTRAL_API_KEY:
         raise RuntimeError("CENTRAL_API_KEY not set")
 
     init_dbs()
     
     # Start background threads
+    Thread(target=heartbeat_flusher, daemon=True).start()
     Thread(target=monitor_nodes, daemon=True).start()
     Thread(target=buffer_rotator, daemon=True).start()
+
+if __name__ == "__main__":
+    # Development only; production runs under gunicorn (see gunicorn.conf.py)
+    start()
     
-    print("[CENTRAL] Server Online on Port 5000")
-    app.run(host="0.0.0.0", port=int(os.getenv("PORT", 5000)))
+    port = int(os.getenv("PORT", 5000))
+    log.info("Server Online on Port %s", port)
+    app.run(host="0.0.0.0", port=port)
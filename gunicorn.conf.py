@@ -0,0 +1,20 @@
+# Production launch: gunicorn -c gunicorn.conf.py central_server:app
+#
+# Node status, the event queue and the archive batch id live in process
+# memory, so run exactly one worker and scale with threads. /heartbeat only
+# touches memory, but threads still let short requests be served while a
+# large /archive/pull is streaming.
+#
+# A restart loses any data not yet acked by the bot: heartbeats still queued in
+# memory are dropped, and start() wipes buffer.db and archive.db (CLEAN START).
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+workers = 1
+worker_class = "gthread"
+threads = int(os.getenv("WEB_THREADS", 8))
+
+def post_worker_init(worker):
+    # Background threads must start inside the worker, not the master
+    import central_server
+    central_server.start()